@@ -7,7 +7,7 @@ set -o errexit
 pip install -r requirements.txt
 
 # Collect static files
-python manage.py collectstatic --no-input
+python manage.py collectstatic --clear --no-input
 
 # Run migrations
 python manage.py migrate
@@ -1,6 +1,27 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import Note, Reply
-from .applications.model_methods import NoteMethods, ReplyMethods
+
+
+def _content_preview(obj):
+    content = obj.content
+    return content[:50] + '...' if len(content) > 50 else content
+
+
+class RepliedNoteFilter(admin.SimpleListFilter):
+    """Filter replies by note, listing only notes that have replies"""
+    title = 'note'
+    parameter_name = 'note'
+
+    def lookups(self, request, model_admin):
+        note_ids = (Reply.objects.order_by('note_id')
+                    .values_list('note_id', flat=True).distinct())
+        return [(str(note_id), f'Note #{note_id}') for note_id in note_ids]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(note_id=self.value())
+        return queryset
 
 
 @admin.register(Note)
@@ -12,32 +33,42 @@ class NoteAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'created_at'
 
+    def get_queryset(self, request):
+        # Count replies in the changelist query instead of once per row
+        qs = super().get_queryset(request)
+        return qs.annotate(_reply_count=Count('replies'))
+
     def content_preview(self, obj):
-        return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
+        return _content_preview(obj)
     content_preview.short_description = 'Content Preview'
 
     def get_display_author(self, obj):
-        return NoteMethods.get_display_author(obj)
+        return obj.get_display_author()
     get_display_author.short_description = 'Author'
 
     def get_reply_count(self, obj):
-        return NoteMethods.get_reply_count(obj)
+        return obj.get_reply_count()
     get_reply_count.short_description = 'Replies'
+    get_reply_count.admin_order_field = '_reply_count'
 
 
 @admin.register(Reply)
 class ReplyAdmin(admin.ModelAdmin):
     list_display = ['id', 'content_preview',
                     'get_display_author', 'is_anonymous', 'note', 'created_at']
-    list_filter = ['is_anonymous', 'created_at', 'note']
+    list_filter = ['is_anonymous', 'created_at', RepliedNoteFilter]
+    list_select_related = ('note',)
+    list_per_page = 50
+    show_full_result_count = False
+    raw_id_fields = ('note',)
     search_fields = ['content', 'author_name', 'note__content']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'created_at'
 
     def content_preview(self, obj):
-        return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
+        return _content_preview(obj)
     content_preview.short_description = 'Content Preview'
 
     def get_display_author(self, obj):
-        return ReplyMethods.get_display_author(obj)
+        return obj.get_display_author()
     get_display_author.short_description = 'Author'
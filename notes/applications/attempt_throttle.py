@@ -0,0 +1,104 @@
+"""
+Attempt Throttle using Fixed Time Windows
+=========================================
+
+This module implements a per-key throttle that allows at most `limit`
+attempts per `window` seconds for each key (e.g. a username or client IP).
+
+While RateLimiter bounds how many operations run *at the same time*, this
+throttle bounds how many operations may *start* within a period of time.
+It is used in front of password checks: verifying a password runs the
+configured key derivation function (PBKDF2 with hundreds of thousands of
+iterations), so rejecting repeated attempts before that point keeps a burst
+of bad credentials from consuming a worker's CPU.
+
+Each key tracks the start of its current window and the attempts made in it:
+
+  t=0s   attempt 1..5  -> allowed (count 1..5)
+  t=10s  attempt 6     -> rejected (count already at limit)
+  t=60s  attempt 7     -> allowed (window expired, count restarts at 1)
+
+The window table is shared by all request threads, so it is guarded by a
+mutex (threading.Lock).
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class AttemptThrottle:
+    """
+    Thread-safe fixed-window attempt throttle.
+
+    Attributes:
+        limit: Maximum number of attempts per key within one window
+        window: Length of a window (seconds)
+        max_keys: Number of tracked keys above which expired windows are pruned
+        _windows: Dictionary mapping keys to (window start, attempt count)
+        _lock: threading.Lock (mutex) protecting _windows
+    """
+
+    __slots__ = ('limit', 'window', 'max_keys', '_windows', '_lock')
+
+    def __init__(self, limit: int, window: float = 60.0, max_keys: int = 10000):
+        """
+        Initialize the throttle.
+
+        Args:
+            limit: Maximum number of attempts per key within one window
+            window: Length of a window (seconds)
+            max_keys: Number of tracked keys above which expired windows are pruned
+        """
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()  # Mutex for thread safety
+
+    def hit(self, key: str) -> bool:
+        """
+        Record an attempt for a key (thread-safe).
+
+        Rejected attempts are not counted, so a key becomes usable again as
+        soon as its window expires.
+
+        Args:
+            key: Identifier being throttled (e.g. 'username:alice')
+
+        Returns:
+            True if the attempt is allowed, False if the key is over its limit
+        """
+        now = time.monotonic()
+        with self._lock:
+            start, count = self._windows.get(key, (now, 0))
+            if now - start >= self.window:
+                start, count = now, 0
+            if count >= self.limit:
+                return False
+            if key not in self._windows and len(self._windows) >= self.max_keys:
+                self._prune(now)
+            self._windows[key] = (start, count + 1)
+            return True
+
+    def _prune(self, now: float) -> None:
+        """Drop expired windows (caller must hold the lock)."""
+        expired = [key for key, (start, _) in self._windows.items()
+                   if now - start >= self.window]
+        for key in expired:
+            del self._windows[key]
+
+    def reset(self) -> None:
+        """
+        Forget all recorded attempts (thread-safe).
+
+        Useful for testing.
+        """
+        with self._lock:
+            self._windows.clear()
+
+
+# Global throttles for the login endpoint
+# NOTE: Like db_rate_limiter, each Gunicorn worker process keeps its own counts.
+login_username_throttle = AttemptThrottle(limit=5, window=60.0)
+login_ip_throttle = AttemptThrottle(limit=20, window=60.0)
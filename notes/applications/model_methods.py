@@ -1,43 +1,49 @@
 from django.utils import timezone
 
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+
+def format_date(value):
+    """Formats a date like strftime('%B %d, %Y') without the locale lookup"""
+    return f"{_MONTHS[value.month - 1]} {value.day:02d}, {value.year}"
+
 
 class NoteMethods:
-    """Methods and properties for Note model"""
+    """Methods and properties for Note model (mixed into Note)"""
 
-    @staticmethod
-    def get_display_author(note):
+    def get_display_author(self):
         """Returns the author name to display"""
-        if note.is_anonymous or not note.author_name:
+        if self.is_anonymous or not self.author_name:
             return "Anonymous"
-        return note.author_name
+        return self.author_name
 
-    @staticmethod
-    def get_reply_count(note):
+    def get_reply_count(self):
         """Returns the number of replies to this note"""
-        return note.replies.count()
+        reply_count = getattr(self, '_reply_count', None)
+        if reply_count is not None:
+            return reply_count
+        return self.replies.count()
 
-    @staticmethod
-    def get_str_representation(note):
+    def get_str_representation(self):
         """Returns string representation of the note"""
-        if note.is_anonymous or not note.author_name:
-            return f"Anonymous Note - {note.created_at.strftime('%B %d, %Y')}"
-        return f"{note.author_name}'s Note - {note.created_at.strftime('%B %d, %Y')}"
+        if self.is_anonymous or not self.author_name:
+            return f"Anonymous Note - {format_date(self.created_at)}"
+        return f"{self.author_name}'s Note - {format_date(self.created_at)}"
 
 
 class ReplyMethods:
-    """Methods and properties for Reply model"""
+    """Methods and properties for Reply model (mixed into Reply)"""
 
-    @staticmethod
-    def get_display_author(reply):
+    def get_display_author(self):
         """Returns the author name to display"""
-        if reply.is_anonymous or not reply.author_name:
+        if self.is_anonymous or not self.author_name:
             return "Anonymous"
-        return reply.author_name
+        return self.author_name
 
-    @staticmethod
-    def get_str_representation(reply):
+    def get_str_representation(self):
         """Returns string representation of the reply"""
-        if reply.is_anonymous or not reply.author_name:
-            return f"Anonymous Reply to {reply.note}"
-        return f"{reply.author_name}'s Reply to {reply.note}"
+        if self.is_anonymous or not self.author_name:
+            return f"Anonymous Reply to {self.note}"
+        return f"{self.author_name}'s Reply to {self.note}"
 
@@ -1,4 +1,68 @@
 from django.core.exceptions import ValidationError
+from django.core.validators import (EMPTY_VALUES, MaxLengthValidator,
+                                    ProhibitNullCharactersValidator)
+
+from ..models import Note, Reply
+
+_prohibit_null_characters = ProhibitNullCharactersValidator()
+
+
+def _to_text(value):
+    """Coerce a submitted value like forms.CharField does (str, then strip)"""
+    if value in EMPTY_VALUES:
+        return ''
+    return str(value).strip()
+
+
+def _run_validators(value, validators):
+    """Run validators like a form field does, collecting every message"""
+    messages = []
+    for validator in validators:
+        try:
+            validator(value)
+        except ValidationError as e:
+            messages.extend(e.messages)
+    return messages
+
+
+def _validate_payload(data, model, validate_content):
+    """
+    Validate a submitted {'content', 'author_name'} payload without a Form.
+
+    Runs the same checks the model form did: required content, the model's
+    author_name max_length, no null characters, then validate_content.
+
+    Returns (cleaned_data, None) when valid, or (None, errors) where errors
+    maps field names to lists of messages, like form.errors.
+    """
+    errors = {}
+    cleaned_data = {}
+
+    content = _to_text(data.get('content'))
+    if not content:
+        errors['content'] = ['This field is required.']
+    else:
+        messages = _run_validators(content, [_prohibit_null_characters])
+        if not messages:
+            try:
+                cleaned_data['content'] = validate_content(content)
+            except ValidationError as e:
+                messages = e.messages
+        if messages:
+            errors['content'] = messages
+
+    author_name = _to_text(data.get('author_name')) or None
+    if author_name is not None:
+        max_length = model._meta.get_field('author_name').max_length
+        messages = _run_validators(
+            author_name, [MaxLengthValidator(max_length), _prohibit_null_characters])
+        if messages:
+            errors['author_name'] = messages
+    cleaned_data['author_name'] = author_name
+
+    if errors:
+        return None, errors
+    return cleaned_data, None
 
 
 class NoteValidator:
@@ -7,18 +71,25 @@ class NoteValidator:
     @staticmethod
     def validate_content(content):
         """Validate note content"""
-        if not content or len(content.strip()) < 10:
+        stripped = content.strip() if content else ''
+        if len(stripped) < 10:
             raise ValidationError(
                 "Please share at least 10 characters of your thoughts.")
-        return content.strip()
+        return stripped
 
     @staticmethod
     def validate_author_name(author_name):
         """Validate author name"""
-        if author_name and len(author_name.strip()) < 2:
+        stripped = author_name.strip() if author_name else None
+        if stripped is not None and len(stripped) < 2:
             raise ValidationError(
                 "Author name must be at least 2 characters long.")
-        return author_name.strip() if author_name else None
+        return stripped
+
+    @staticmethod
+    def validate_payload(data):
+        """Validate a submitted note payload; returns (cleaned_data, errors)"""
+        return _validate_payload(data, Note, NoteValidator.validate_content)
 
 
 class ReplyValidator:
@@ -27,16 +98,22 @@ class ReplyValidator:
     @staticmethod
     def validate_content(content):
         """Validate reply content"""
-        if not content or len(content.strip()) < 5:
+        stripped = content.strip() if content else ''
+        if len(stripped) < 5:
             raise ValidationError(
                 "Please write at least 5 characters for your response.")
-        return content.strip()
+        return stripped
 
     @staticmethod
     def validate_author_name(author_name):
         """Validate author name"""
-        if author_name and len(author_name.strip()) < 2:
+        stripped = author_name.strip() if author_name else None
+        if stripped is not None and len(stripped) < 2:
             raise ValidationError(
                 "Author name must be at least 2 characters long.")
-        return author_name.strip() if author_name else None
+        return stripped
 
+    @staticmethod
+    def validate_payload(data):
+        """Validate a submitted reply payload; returns (cleaned_data, errors)"""
+        return _validate_payload(data, Reply, ReplyValidator.validate_content)
@@ -0,0 +1,40 @@
+"""
+Server-side Cache for Serialized Notes Pages
+============================================
+
+This module caches the JSON bytes returned by the notes list endpoint in
+Django's cache framework (django.core.cache.cache), so a repeated request
+for the same page skips the page query, the ORM and serialization.
+
+Pages are keyed by the ETag of the response they belong to. The ETag is
+built from live aggregates (latest update time and row count of notes and
+replies, plus page and page size), so any change to the data yields a new
+key and a cached body can never disagree with the ETag sent alongside it:
+
+  ETag "3f2a...":  notes:3f2a... -> b'{"notes": [...]}'
+  new reply:       ETag becomes "9c1d..."
+  next GET:        notes:9c1d... -> miss, rebuilt and cached
+
+No invalidation is needed, so this also holds when another Gunicorn worker
+(with its own LocMemCache) handled the write. Entries for old ETags simply
+expire.
+"""
+
+from django.core.cache import cache
+
+PAGE_TIMEOUT = 30  # Seconds a cached page may be kept
+
+
+def page_key(etag: str) -> str:
+    """Build the cache key of the notes page served with an ETag."""
+    return f'notes:{etag}'
+
+
+def get_page(key):
+    """Return the cached page bytes for a key, or None on a miss."""
+    return cache.get(key)
+
+
+def set_page(key, body: bytes) -> None:
+    """Cache the serialized bytes of a notes page."""
+    cache.set(key, body, PAGE_TIMEOUT)
@@ -34,6 +34,8 @@ class RateLimiter:
         timeout: Maximum time to wait for semaphore acquisition (seconds)
     """
     
+    __slots__ = ('semaphore', 'max_concurrent', 'timeout')
+    
     def __init__(self, max_concurrent: int = 5, timeout: Optional[float] = None):
         """
         Initialize the rate limiter.
@@ -45,8 +47,6 @@ class RateLimiter:
         self.semaphore = threading.Semaphore(max_concurrent)
         self.max_concurrent = max_concurrent
         self.timeout = timeout
-        self._acquired_count = 0
-        self._lock = threading.Lock()  # Protect _acquired_count
     
     def acquire(self, blocking: bool = True) -> bool:
         """
@@ -71,10 +71,6 @@ class RateLimiter:
         else:
             acquired = self.semaphore.acquire(blocking=False)
         
-        if acquired:
-            with self._lock:
-                self._acquired_count += 1
-        
         return acquired
     
     def release(self) -> None:
@@ -84,9 +80,6 @@ class RateLimiter:
         This method releases the semaphore, allowing another waiting thread
         to acquire it. Must be called after acquire() to prevent resource leaks.
         """
-        with self._lock:
-            if self._acquired_count > 0:
-                self._acquired_count -= 1
         self.semaphore.release()
     
     def get_available_slots(self) -> int:
@@ -96,10 +89,9 @@ class RateLimiter:
         Returns:
             Approximate number of available concurrent slots
         """
-        # Semaphore doesn't expose internal counter, so we estimate
-        # based on max_concurrent and acquired count
-        with self._lock:
-            return max(0, self.max_concurrent - self._acquired_count)
+        # Read the semaphore's own counter instead of tracking acquisitions
+        # separately; CPython's Semaphore keeps it in _value
+        return max(0, self.semaphore._value)
     
     def __enter__(self):
         """Context manager entry: acquire semaphore."""
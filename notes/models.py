@@ -1,8 +1,9 @@
 from django.db import models
 from django.utils import timezone
+from .applications.model_methods import NoteMethods, ReplyMethods
 
 
-class Note(models.Model):
+class Note(NoteMethods, models.Model):
     """Model for storing user thoughts/notes"""
     content = models.TextField(
         help_text="Your thoughts to share with the world")
@@ -19,12 +20,18 @@ class Note(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['created_at']),
-            models.Index(fields=['is_anonymous']),
+            models.Index(fields=['-created_at', '-id'], name='note_createdat_id_desc'),
+            models.Index(fields=['is_anonymous', '-created_at'],
+                         name='note_isanon_createdat_desc'),
+            # MAX(updated_at) for the notes list ETag
+            models.Index(fields=['updated_at'], name='note_updatedat'),
         ]
 
+    def __str__(self):
+        return self.get_str_representation()
 
-class Reply(models.Model):
+
+class Reply(ReplyMethods, models.Model):
     """Model for storing replies to notes"""
     note = models.ForeignKey(
         Note, on_delete=models.CASCADE, related_name='replies')
@@ -46,4 +53,10 @@ class Reply(models.Model):
             models.Index(fields=['created_at']),
             models.Index(fields=['is_anonymous']),
             models.Index(fields=['note', 'created_at']),
+            # MAX(updated_at) for the notes list and note detail ETags
+            models.Index(fields=['updated_at'], name='reply_updatedat'),
+            models.Index(fields=['note', 'updated_at'], name='reply_note_updatedat'),
         ]
+
+    def __str__(self):
+        return self.get_str_representation()
@@ -1,3 +1,513 @@
-from django.test import TestCase
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import orjson
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+
+from . import views
+from .applications.attempt_throttle import (AttemptThrottle, login_ip_throttle,
+                                            login_username_throttle)
+from .applications.model_methods import format_date
+from .applications.note_validators import NoteValidator, ReplyValidator
+from .applications.request_counter import RequestCounter, request_counter
+from .forms import NoteForm, ReplyForm
+from .models import Note, Reply
+
+
+# Tests run with DEBUG off, where the manifest storage needs collectstatic output
+PLAIN_STATIC_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(STORAGES=PLAIN_STATIC_STORAGES)
+class AdminChangelistTests(TestCase):
+    """Admin list pages render every row's own display values"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pass')
+        self.client.force_login(self.admin)
+
+    def test_note_changelist_shows_each_author(self):
+        Note.objects.create(content='first note content', author_name='Alice',
+                            is_anonymous=False)
+        Note.objects.create(content='second note content', is_anonymous=True)
+
+        response = self.client.get('/admin/notes/note/')
+
+        self.assertContains(response, 'Alice')
+        self.assertContains(response, 'Anonymous')
+
+    def test_reply_changelist_shows_each_author(self):
+        note = Note.objects.create(content='a note with replies')
+        Reply.objects.create(note=note, content='reply by bob', author_name='Bob',
+                             is_anonymous=False)
+        Reply.objects.create(note=note, content='anonymous reply', is_anonymous=True)
+
+        response = self.client.get('/admin/notes/reply/')
+
+        self.assertContains(response, 'Bob')
+        self.assertContains(response, 'Anonymous')
+
+
+class NoteReplyCountTests(TestCase):
+    """Note.get_reply_count prefers an annotated count over a query"""
+
+    def setUp(self):
+        self.note = Note.objects.create(content='a note with replies')
+        Reply.objects.create(note=self.note, content='first reply')
+        Reply.objects.create(note=self.note, content='second reply')
+
+    def test_counts_replies_with_a_query(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.note.get_reply_count(), 2)
+
+    def test_uses_annotated_count(self):
+        note = Note.objects.annotate(_reply_count=Count('replies')).get(pk=self.note.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(note.get_reply_count(), 2)
+
+
+class ModelStrTests(TestCase):
+    """__str__ and the date format shared with the API responses"""
+
+    def test_format_date_matches_strftime(self):
+        for month in range(1, 13):
+            value = timezone.now().replace(month=month, day=5)
+            self.assertEqual(format_date(value), value.strftime('%B %d, %Y'))
+
+    def test_str(self):
+        note = Note.objects.create(author_name='Alice', content='hello', is_anonymous=False)
+        reply = Reply.objects.create(note=note, content='hi', is_anonymous=True)
+        created = format_date(note.created_at)
+        self.assertEqual(str(note), f"Alice's Note - {created}")
+        self.assertEqual(str(reply), f"Anonymous Reply to Alice's Note - {created}")
+
+    def test_api_uses_format_date(self):
+        note = Note.objects.create(content='hello')
+        data = orjson.loads(self.client.get(f'/api/notes/{note.pk}/').content)
+        self.assertEqual(data['note']['created_at'], format_date(note.created_at))
+
+
+class RequestCounterTests(TestCase):
+    """Reported totals always match the per-endpoint counts"""
+
+    def test_metrics_reflect_every_request(self):
+        request_counter.reset()
+        self.client.get('/api/notes/')
+        first = self.client.get('/api/metrics/internal/').json()['metrics']
+        self.client.get('/api/notes/1/')
+        second = self.client.get('/api/metrics/internal/').json()['metrics']
+
+        self.assertEqual(first['total_requests'], 1)
+        self.assertEqual(first['endpoint_counts'], {'/api/notes/': 1})
+        self.assertEqual(second['total_requests'], 2)
+        self.assertEqual(second['endpoint_counts'],
+                         {'/api/notes/': 1, '/api/notes/1/': 1})
+
+    def test_total_count_sums_endpoints(self):
+        counter = RequestCounter()
+        counter.increment('/a')
+        counter.increment('/a')
+        counter.increment('/b')
+
+        self.assertEqual(counter.get_total_count(), 3)
+        counter.reset()
+        self.assertEqual(counter.get_total_count(), 0)
+
+    def test_stats_consistent_under_concurrent_increments(self):
+        counter = RequestCounter()
+        done = threading.Event()
+        mismatches = []
+
+        def scrape():
+            while not done.is_set():
+                stats = counter.get_stats()
+                if stats['total_requests'] != sum(stats['endpoint_counts'].values()):
+                    mismatches.append(stats)
+
+        def hit(endpoint):
+            for _ in range(2000):
+                counter.increment(endpoint)
+
+        scraper = threading.Thread(target=scrape)
+        scraper.start()
+        workers = [threading.Thread(target=hit, args=(f'/e{i}',)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        done.set()
+        scraper.join()
+
+        self.assertEqual(mismatches, [])
+        stats = counter.get_stats()
+        self.assertEqual(stats['total_requests'], 8000)
+        self.assertEqual(stats['endpoint_counts'], {f'/e{i}': 2000 for i in range(4)})
+
+
+class SubmitValidationTests(TestCase):
+    """Invalid submissions keep the {'field': [messages]} error shape"""
+
+    def test_short_note_reports_field_errors(self):
+        response = self.client.post('/api/notes/submit/', {'content': 'short'},
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            'success': False,
+            'errors': {'content': ['Please share at least 10 characters of your thoughts.']},
+        })
+
+    def test_null_characters_rejected(self):
+        response = self.client.post('/api/notes/submit/',
+                                    {'content': 'null \x00 byte in content',
+                                     'author_name': 'a\x00b', 'is_anonymous': False},
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['errors'], {
+            'content': ['Null characters are not allowed.'],
+            'author_name': ['Null characters are not allowed.'],
+        })
+        self.assertFalse(Note.objects.exists())
+
+    def test_invalid_json(self):
+        response = self.client.post('/api/notes/submit/', b'{not json',
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'success': False, 'error': 'Invalid JSON data'})
+
+
+class SubmitTests(TestCase):
+    """Submissions are saved once and returned with their primary key"""
+
+    def test_submit_note_saves_one_row(self):
+        response = self.client.post('/api/notes/submit/',
+                                    {'content': 'a brand new note here', 'is_anonymous': True},
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        note_id = response.json()['note']['id']
+        self.assertEqual(list(Note.objects.values_list('id', flat=True)), [note_id])
+
+    def test_submit_reply_saves_one_row(self):
+        note = Note.objects.create(content='a note to reply to')
+
+        response = self.client.post(f'/api/notes/{note.id}/replies/',
+                                    {'content': 'hello reply', 'author_name': 'Sam',
+                                     'is_anonymous': False},
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()['reply']
+        self.assertEqual(body['author'], 'Sam')
+        self.assertEqual(list(note.replies.values_list('id', flat=True)), [body['id']])
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class CurrentUserTests(TestCase):
+    """current_user answers from the session copy of the user until it expires"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('sam', 'sam@example.com', 'secret-pass')
+        self.client.post('/api/auth/login/', {'username': 'sam', 'password': 'secret-pass'},
+                         content_type='application/json')
+
+    def later(self, seconds):
+        """Patch the clock current_user reads to `seconds` from now"""
+        fake_time = mock.patch('notes.views.time').start()
+        self.addCleanup(mock.patch.stopall)
+        fake_time.time.return_value = time.time() + seconds
+
+    def get_user(self):
+        return self.client.get('/api/auth/user/').json()
+
+    def test_fast_path_skips_user_query(self):
+        # Only the session is loaded
+        with self.assertNumQueries(1):
+            body = self.get_user()
+        self.assertEqual(body, {'authenticated': True, 'user': {
+            'id': self.user.id, 'username': 'sam', 'email': 'sam@example.com'}})
+
+    def test_refreshes_after_ttl(self):
+        self.later(views.USER_JSON_TTL + 1)
+        User.objects.filter(pk=self.user.pk).update(email='new@example.com')
+
+        self.assertEqual(self.get_user()['user']['email'], 'new@example.com')
+        expires = self.client.session[views.USER_JSON_SESSION_KEY][2]
+        self.assertGreater(expires, time.time() + views.USER_JSON_TTL)
+
+    def test_entry_for_another_user_ignored(self):
+        session = self.client.session
+        session[views.USER_JSON_SESSION_KEY] = [
+            str(self.user.pk + 1), '{"id": 0, "username": "other", "email": ""}',
+            time.time() + views.USER_JSON_TTL]
+        session.save()
+
+        self.assertEqual(self.get_user()['user']['username'], 'sam')
+        self.assertEqual(self.client.session[views.USER_JSON_SESSION_KEY][0], str(self.user.pk))
+
+    def test_deleted_user_seen_until_ttl(self):
+        # Documented trade-off: the session copy outlives the user for up to USER_JSON_TTL
+        self.user.delete()
+        self.assertTrue(self.get_user()['authenticated'])
+
+        self.later(views.USER_JSON_TTL + 1)
+        self.assertEqual(self.get_user(), {'authenticated': False, 'user': None})
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class RegisterTests(TestCase):
+    """Duplicate usernames are caught by the unique constraint"""
+
+    def register(self, username):
+        return self.client.post('/api/auth/register/',
+                                {'username': username, 'password': 'secret-pass'},
+                                content_type='application/json')
+
+    def test_duplicate_username_rejected(self):
+        self.assertEqual(self.register('sam').status_code, 200)
+
+        response = self.register('sam')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'success': False, 'error': 'Username already exists'})
+        # The failed INSERT was rolled back to its savepoint, so the connection still works
+        self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(self.register('alex').status_code, 200)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class LoginThrottleTests(TestCase):
+    """The per-IP login throttle only trusts addresses appended by a known proxy"""
+
+    def setUp(self):
+        login_ip_throttle.reset()
+        login_username_throttle.reset()
+
+    def attempt(self, i, forwarded_for=None, username=None):
+        # A new username each time so only the per-IP throttle applies
+        headers = {} if forwarded_for is None else {'HTTP_X_FORWARDED_FOR': forwarded_for}
+        return self.client.post('/api/auth/login/',
+                                {'username': username or f'user{i}', 'password': 'wrong'},
+                                content_type='application/json',
+                                REMOTE_ADDR='10.0.0.1', **headers)
+
+    def assert_throttled_after_limit(self, forwarded_for):
+        statuses = [self.attempt(i, forwarded_for(i)).status_code
+                    for i in range(login_ip_throttle.limit + 1)]
+        self.assertEqual(statuses, [401] * login_ip_throttle.limit + [429])
+
+    @override_settings(NUM_TRUSTED_PROXIES=0)
+    def test_ip_throttle_skipped_without_trusted_proxy(self):
+        # REMOTE_ADDR may be a proxy shared by every client, so it is not throttled
+        statuses = {self.attempt(i, f'198.51.100.{i}').status_code
+                    for i in range(login_ip_throttle.limit + 1)}
+        self.assertEqual(statuses, {401})
+
+    @override_settings(NUM_TRUSTED_PROXIES=0)
+    def test_username_throttle_applies_without_trusted_proxy(self):
+        statuses = [self.attempt(i, username='sam').status_code
+                    for i in range(login_username_throttle.limit + 1)]
+        self.assertEqual(statuses, [401] * login_username_throttle.limit + [429])
+
+    @override_settings(NUM_TRUSTED_PROXIES=1)
+    def test_remote_addr_used_without_forwarded_header(self):
+        self.assert_throttled_after_limit(lambda i: None)
+
+    def test_non_string_username_rejected(self):
+        response = self.client.post('/api/auth/login/',
+                                    {'username': ['sam'], 'password': 'wrong'},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {
+            'success': False, 'error': 'Invalid username or password'})
+
+    @override_settings(NUM_TRUSTED_PROXIES=1)
+    def test_spoofed_hops_ignored_behind_proxy(self):
+        # nginx appends the real peer after whatever the client sent
+        self.assert_throttled_after_limit(lambda i: f'198.51.100.{i}, 203.0.113.7')
+
+    @override_settings(NUM_TRUSTED_PROXIES=1)
+    def test_clients_behind_proxy_throttled_separately(self):
+        self.assert_throttled_after_limit(lambda i: '203.0.113.7')
+        response = self.attempt(99, '203.0.113.8')
+        self.assertEqual(response.status_code, 401)
+
+
+class ValidatePayloadTests(TestCase):
+    """validate_payload() accepts and rejects exactly what the model forms did"""
+
+    PAYLOADS = [
+        {'content': '  a long enough note ', 'author_name': '  Sam '},
+        {'content': 'a long enough note', 'author_name': '   '},
+        {'content': 123456789012, 'author_name': 5},
+        {'content': 'short'},
+        {'content': None},
+        {'content': []},
+        {},
+        {'content': 'a long enough note', 'author_name': 'x' * 101},
+        {'content': 'null \x00 in the note', 'author_name': 'x\x00' + 'y' * 100},
+        {'content': 'ab\x00'},
+    ]
+
+    def assert_matches_form(self, form_class, validator):
+        for payload in self.PAYLOADS:
+            with self.subTest(payload=payload):
+                form = form_class(payload)
+                if form.is_valid():
+                    expected = ({'content': form.cleaned_data['content'],
+                                 'author_name': form.cleaned_data['author_name']}, None)
+                else:
+                    expected = (None, dict(form.errors))
+                self.assertEqual(validator.validate_payload(payload), expected)
+
+    def test_note_payload_matches_note_form(self):
+        self.assert_matches_form(NoteForm, NoteValidator)
+
+    def test_reply_payload_matches_reply_form(self):
+        self.assert_matches_form(ReplyForm, ReplyValidator)
+
+
+class NotesListTests(TestCase):
+    """The notes list reuses the ETag fingerprint for pagination and caching"""
+
+    def setUp(self):
+        cache.clear()
+        for i in range(5):
+            Note.objects.create(content=f'note number {i} content')
+
+    def get_page(self, url):
+        response = self.client.get(url)
+        return response, orjson.loads(response.content)
+
+    def test_pagination_uses_the_fingerprint_count(self):
+        # Two fingerprint aggregates and the page query; no separate COUNT(*)
+        with self.assertNumQueries(3):
+            response, body = self.get_page('/api/notes/?per_page=2')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['total_pages'], 3)
+        self.assertEqual(len(body['notes']), 2)
+        self.assertTrue(body['has_next'])
+
+    def test_repeated_request_served_from_cache(self):
+        _, first = self.get_page('/api/notes/')
+        # Only the fingerprint aggregates behind the ETag
+        with self.assertNumQueries(2):
+            _, second = self.get_page('/api/notes/')
+        self.assertEqual(first, second)
+
+    def test_cached_body_matches_etag_after_unsignalled_change(self):
+        response, _ = self.get_page('/api/notes/')
+        old_etag = response['ETag']
+        # update() sends no signals, like a write handled by another worker
+        note = Note.objects.order_by('-created_at', '-id').first()
+        Note.objects.filter(pk=note.pk).update(
+            content='edited without signals', updated_at=timezone.now() + timedelta(seconds=5))
+
+        response, body = self.get_page('/api/notes/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], old_etag)
+        self.assertEqual(body['notes'][0]['content'], 'edited without signals')
+
+        revalidated = self.client.get('/api/notes/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_response_is_buffered_with_content_length(self):
+        response = self.client.get('/api/notes/')
+        self.assertFalse(response.streaming)
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+
+    def test_invalid_paging_rejected(self):
+        for query in ('page=abc', 'per_page=1.5'):
+            with self.subTest(query=query):
+                response = self.client.get(f'/api/notes/?{query}')
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {
+                    'success': False, 'error': 'page and per_page must be integers'})
+
+    def test_per_page_capped(self):
+        for i in range(55):
+            Note.objects.create(content=f'extra note {i} content')
+
+        _, body = self.get_page('/api/notes/?per_page=1000000')
+
+        self.assertEqual(len(body['notes']), 50)
+        self.assertEqual(body['total_pages'], 2)
+
+    def test_if_modified_since_ignored_after_delete(self):
+        # Deleting an older note leaves MAX(updated_at) unchanged, so only the
+        # ETag can tell the list changed; no Last-Modified is sent
+        response = self.client.get('/api/notes/')
+        self.assertNotIn('Last-Modified', response)
+        Note.objects.order_by('created_at').first().delete()
+
+        response = self.client.get('/api/notes/',
+                                   HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['notes']), 4)
+
+    def test_note_detail_if_modified_since_ignored_after_reply_delete(self):
+        note = Note.objects.first()
+        Reply.objects.create(note=note, content='first reply')
+        Reply.objects.create(note=note, content='second reply')
+        url = f'/api/notes/{note.pk}/'
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+        Reply.objects.filter(note=note).order_by('created_at').first().delete()
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['note']['reply_count'], 1)
+
+
+class AttemptThrottleTests(TestCase):
+    """Fixed-window throttle behaviour, with the clock under test control"""
+
+    def setUp(self):
+        patcher = mock.patch('notes.applications.attempt_throttle.time.monotonic',
+                             return_value=1000.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejects_over_limit_until_window_expires(self):
+        throttle = AttemptThrottle(limit=2, window=60.0)
+
+        self.assertEqual([throttle.hit('k') for _ in range(3)], [True, True, False])
+        self.clock.return_value = 1059.0
+        self.assertFalse(throttle.hit('k'))
+        self.clock.return_value = 1060.0
+        self.assertTrue(throttle.hit('k'))
+
+    def test_keys_are_independent(self):
+        throttle = AttemptThrottle(limit=1, window=60.0)
+
+        self.assertTrue(throttle.hit('a'))
+        self.assertFalse(throttle.hit('a'))
+        self.assertTrue(throttle.hit('b'))
+
+    def test_expired_windows_pruned_at_max_keys(self):
+        throttle = AttemptThrottle(limit=1, window=60.0, max_keys=2)
+        throttle.hit('a')
+        throttle.hit('b')
+        self.clock.return_value = 1061.0
+
+        self.assertTrue(throttle.hit('c'))
+        self.assertEqual(set(throttle._windows), {'c'})
+
+    def test_reset_forgets_attempts(self):
+        throttle = AttemptThrottle(limit=1, window=60.0)
+        throttle.hit('k')
+        throttle.reset()
+        self.assertTrue(throttle.hit('k'))
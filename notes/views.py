@@ -1,53 +1,189 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET, require_POST
 from django.core.paginator import Paginator
-from django.contrib.auth import authenticate, login, logout
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.contrib.auth import SESSION_KEY, authenticate, login, logout
 from django.contrib.auth.models import User
-import json
+import hashlib
+import time
+import orjson
 from .models import Note, Reply
-from .forms import NoteForm, ReplyForm
-from .applications.model_methods import NoteMethods, ReplyMethods
+from .applications import notes_cache
+from .applications.note_validators import NoteValidator, ReplyValidator
+from .applications.model_methods import format_date
+from .applications.attempt_throttle import login_ip_throttle, login_username_throttle
 from .applications.rate_limiter import db_rate_limiter
 from .applications.request_counter import request_counter
 from .applications.sync_demo import demonstrate_race_condition
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
 
-@require_http_methods(["GET"])
+
+class ORJSONResponse(HttpResponse):
+    """An HTTP response whose data is serialized to JSON with orjson"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(
+            content=orjson.dumps(data, option=_ORJSON_OPTIONS),
+            **kwargs)
+
+
+ABOUT_VERSION = '1.0.0'
+
+NOTES_PER_PAGE = 8
+MAX_NOTES_PER_PAGE = 50  # Bounds the rows a single notes list request can fetch
+
+REPLY_DATE_FMT = '%B %d, %Y at %I:%M %p'
+
+# The about payload never changes, so it is serialized once at import
+_ABOUT_BYTES = orjson.dumps({
+    'about': {
+        'name': 'Pour Your Mind',
+        'description': 'A platform to share your thoughts with the world, either anonymously or with your name.',
+        'features': [
+            'Share thoughts publicly',
+            'Post anonymously or with your name',
+            'Reply to others\' thoughts',
+            'View all thoughts in a feed'
+        ],
+        'version': ABOUT_VERSION
+    }
+})
+
+# Fixed replies are also serialized once instead of on every call
+_LOGGED_OUT = orjson.dumps({'success': True, 'message': 'Logged out successfully'})
+_INVALID_JSON = orjson.dumps({'success': False, 'error': 'Invalid JSON data'})
+_CREDS_REQUIRED = orjson.dumps({'success': False, 'error': 'Username and password are required'})
+_INVALID_CREDS = orjson.dumps({'success': False, 'error': 'Invalid username or password'})
+_USERNAME_TAKEN = orjson.dumps({'success': False, 'error': 'Username already exists'})
+_LOGIN_THROTTLED = orjson.dumps(
+    {'success': False, 'error': 'Too many login attempts. Please try again later.'})
+_RATE_LIMITED = orjson.dumps(
+    {'success': False, 'error': 'Rate limit exceeded. Too many concurrent requests.'})
+_INVALID_PAGING = orjson.dumps(
+    {'success': False, 'error': 'page and per_page must be integers'})
+
+
+# ============== Conditional GET Helpers ==============
+
+def _notes_paging(request):
+    """Parse (page, per_page) from the query string, or None if they are not integers"""
+    if not hasattr(request, '_notes_paging'):
+        try:
+            page = max(1, int(request.GET.get('page', 1)))
+            per_page = max(1, min(int(request.GET.get('per_page', NOTES_PER_PAGE)),
+                                  MAX_NOTES_PER_PAGE))
+        except ValueError:
+            request._notes_paging = None
+        else:
+            request._notes_paging = (page, per_page)
+    return request._notes_paging
+
+
+def _notes_fingerprint(request):
+    """Latest update time and row counts of notes and replies, computed once per request"""
+    if not hasattr(request, '_notes_fingerprint'):
+        notes = Note.objects.aggregate(updated=Max('updated_at'), count=Count('id'))
+        replies = Reply.objects.aggregate(updated=Max('updated_at'), count=Count('id'))
+        request._notes_fingerprint = (notes, replies)
+    return request._notes_fingerprint
+
+
+def _note_detail_fingerprint(request, note_id):
+    """Update times and reply count of one note, or None if it does not exist"""
+    if not hasattr(request, '_note_detail_fingerprint'):
+        note_updated = (Note.objects.filter(id=note_id)
+                        .values_list('updated_at', flat=True).first())
+        replies = None
+        if note_updated is not None:
+            replies = Reply.objects.filter(note_id=note_id).aggregate(
+                updated=Max('updated_at'), count=Count('id'))
+        request._note_detail_fingerprint = (note_updated, replies)
+    return request._note_detail_fingerprint
+
+
+def _notes_etag(request):
+    paging = _notes_paging(request)
+    if paging is None:
+        return None
+    notes, replies = _notes_fingerprint(request)
+    key = (f"{notes['updated']}|{notes['count']}|{replies['updated']}|{replies['count']}|"
+           f"{paging[0]}|{paging[1]}")
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _note_detail_etag(request, note_id):
+    note_updated, replies = _note_detail_fingerprint(request, note_id)
+    if note_updated is None:
+        return None
+    key = f"{note_id}|{note_updated}|{replies['updated']}|{replies['count']}"
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def _about_etag(request):
+    return f'about-v{ABOUT_VERSION}'
+
+
+@require_GET
+@cache_control(no_cache=True)
+@condition(etag_func=_notes_etag)
 def get_notes(request):
     """API endpoint to get all notes with pagination"""
     # Track request with thread-safe counter
     request_counter.increment('/api/notes/')
 
-    page = request.GET.get('page', 1)
-    per_page = request.GET.get('per_page', 8)
-
-    notes = Note.objects.all()
+    paging = _notes_paging(request)
+    if paging is None:
+        return HttpResponse(_INVALID_PAGING, content_type='application/json', status=400)
+    page, per_page = paging
+
+    # Serve the serialized page from the cache; the key is this response's
+    # ETag, so the cached body always matches the data the ETag describes
+    cache_key = notes_cache.page_key(_notes_etag(request))
+    body = notes_cache.get_page(cache_key)
+    if body is not None:
+        return HttpResponse(body, content_type='application/json')
+
+    # Fetch plain rows (no model instances) with replies counted in the same query
+    notes = (Note.objects
+             .values('id', 'content', 'author_name', 'is_anonymous', 'created_at')
+             .annotate(reply_count=Count('replies'))
+             .order_by('-created_at', '-id'))
     paginator = Paginator(notes, per_page)
+    # The ETag fingerprint already counted the notes in this request
+    paginator.count = _notes_fingerprint(request)[0]['count']
     page_obj = paginator.get_page(page)
 
-    notes_data = []
-    for note in page_obj:
-        notes_data.append({
-            'id': note.id,
-            'content': note.content,
-            'author': NoteMethods.get_display_author(note),
-            'is_anonymous': note.is_anonymous,
-            'created_at': note.created_at.strftime('%B %d, %Y'),
-            'reply_count': NoteMethods.get_reply_count(note)
-        })
-
-    return JsonResponse({
+    notes_data = [{
+        'id': row['id'],
+        'content': row['content'],
+        'author': ('Anonymous' if row['is_anonymous'] or not row['author_name']
+                   else row['author_name']),
+        'is_anonymous': row['is_anonymous'],
+        'created_at': format_date(row['created_at']),
+        'reply_count': row['reply_count']
+    } for row in page_obj]
+
+    response = ORJSONResponse({
         'notes': notes_data,
         'has_next': page_obj.has_next(),
         'has_previous': page_obj.has_previous(),
         'current_page': page_obj.number,
         'total_pages': paginator.num_pages
     })
+    notes_cache.set_page(cache_key, response.content)
+    return response
 
 
-@require_http_methods(["GET"])
+@require_GET
+@cache_control(no_cache=True)
+@condition(etag_func=_note_detail_etag)
 def get_note_detail(request, note_id):
     """API endpoint to get a single note with its replies"""
     # Track request with thread-safe counter
@@ -55,31 +191,34 @@ def get_note_detail(request, note_id):
 
     note = get_object_or_404(Note, id=note_id)
 
-    replies_data = []
-    for reply in note.replies.all():
-        replies_data.append({
-            'id': reply.id,
-            'content': reply.content,
-            'author': ReplyMethods.get_display_author(reply),
-            'is_anonymous': reply.is_anonymous,
-            'created_at': reply.created_at.strftime('%B %d, %Y at %I:%M %p')
-        })
+    # Load replies once as plain rows; the reply count is the length of the list
+    replies = note.replies.values(
+        'id', 'content', 'author_name', 'is_anonymous', 'created_at')
+
+    replies_data = [{
+        'id': row['id'],
+        'content': row['content'],
+        'author': ('Anonymous' if row['is_anonymous'] or not row['author_name']
+                   else row['author_name']),
+        'is_anonymous': row['is_anonymous'],
+        'created_at': row['created_at'].strftime(REPLY_DATE_FMT)
+    } for row in replies]
 
     note_data = {
         'id': note.id,
         'content': note.content,
-        'author': NoteMethods.get_display_author(note),
+        'author': note.get_display_author(),
         'is_anonymous': note.is_anonymous,
-        'created_at': note.created_at.strftime('%B %d, %Y'),
+        'created_at': format_date(note.created_at),
         'replies': replies_data,
-        'reply_count': NoteMethods.get_reply_count(note)
+        'reply_count': len(replies_data)
     }
 
-    return JsonResponse({'note': note_data})
+    return ORJSONResponse({'note': note_data})
 
 
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def submit_note(request):
     """API endpoint to submit a new note"""
     # Track request with thread-safe counter
@@ -88,61 +227,49 @@ def submit_note(request):
     # Apply rate limiting using semaphore (limits concurrent database writes)
     # Use blocking=False to return 429 immediately when at capacity (better for testing)
     if not db_rate_limiter.acquire(blocking=False):
-        return JsonResponse({
-            'success': False,
-            'error': 'Rate limit exceeded. Too many concurrent requests.'
-        }, status=429)
+        return HttpResponse(_RATE_LIMITED, content_type='application/json', status=429)
 
     try:
-        data = json.loads(request.body)
-
-        # Extract only the fields the form expects
-        form_data = {
-            'content': data.get('content', ''),
-            'author_name': data.get('author_name', '')
-        }
+        data = orjson.loads(request.body)
 
-        form = NoteForm(form_data)
+        # Validate only the fields a note accepts
+        cleaned_data, errors = NoteValidator.validate_payload(data)
 
-        if form.is_valid():
-            note = form.save(commit=False)
+        if not errors:
+            note = Note(**cleaned_data)
 
             # Handle anonymous posting from frontend
             is_anonymous = data.get('is_anonymous', True)
-            if is_anonymous or not form.cleaned_data.get('author_name'):
+            if is_anonymous or not cleaned_data['author_name']:
                 note.is_anonymous = True
                 note.author_name = ''
             else:
                 note.is_anonymous = False
 
             # Simulate database write time (helps with rate limiter testing)
-            import time
             time.sleep(0.2)  # 200ms delay to simulate database write
 
             note.save()
 
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': True,
                 'note': {
                     'id': note.id,
                     'content': note.content,
-                    'author': NoteMethods.get_display_author(note),
+                    'author': note.get_display_author(),
                     'is_anonymous': note.is_anonymous,
-                    'created_at': note.created_at.strftime('%B %d, %Y')
+                    'created_at': format_date(note.created_at)
                 }
             })
         else:
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': False,
-                'errors': form.errors
+                'errors': errors
             }, status=400)
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'success': False,
-            'error': 'Invalid JSON data'
-        }, status=400)
+    except orjson.JSONDecodeError:
+        return HttpResponse(_INVALID_JSON, content_type='application/json', status=400)
     except Exception as e:
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -152,7 +279,7 @@ def submit_note(request):
 
 
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def submit_reply(request, note_id):
     """API endpoint to submit a reply to a note"""
     # Track request with thread-safe counter
@@ -161,63 +288,50 @@ def submit_reply(request, note_id):
     # Apply rate limiting using semaphore (limits concurrent database writes)
     # Use blocking=False to return 429 immediately when at capacity (better for testing)
     if not db_rate_limiter.acquire(blocking=False):
-        return JsonResponse({
-            'success': False,
-            'error': 'Rate limit exceeded. Too many concurrent requests.'
-        }, status=429)
+        return HttpResponse(_RATE_LIMITED, content_type='application/json', status=429)
 
     try:
         note = get_object_or_404(Note, id=note_id)
-        data = json.loads(request.body)
-
-        # Extract only the fields the form expects
-        form_data = {
-            'content': data.get('content', ''),
-            'author_name': data.get('author_name', '')
-        }
+        data = orjson.loads(request.body)
 
-        form = ReplyForm(form_data)
+        # Validate only the fields a reply accepts
+        cleaned_data, errors = ReplyValidator.validate_payload(data)
 
-        if form.is_valid():
-            reply = form.save(commit=False)
-            reply.note = note
+        if not errors:
+            reply = Reply(note=note, **cleaned_data)
 
             # Handle anonymous posting from frontend
             is_anonymous = data.get('is_anonymous', True)
-            if is_anonymous or not form.cleaned_data.get('author_name'):
+            if is_anonymous or not cleaned_data['author_name']:
                 reply.is_anonymous = True
                 reply.author_name = ''
             else:
                 reply.is_anonymous = False
 
             # Simulate database write time (helps with rate limiter testing)
-            import time
             time.sleep(0.2)  # 200ms delay to simulate database write
 
             reply.save()
 
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': True,
                 'reply': {
                     'id': reply.id,
                     'content': reply.content,
-                    'author': ReplyMethods.get_display_author(reply),
+                    'author': reply.get_display_author(),
                     'is_anonymous': reply.is_anonymous,
-                    'created_at': reply.created_at.strftime('%B %d, %Y at %I:%M %p')
+                    'created_at': reply.created_at.strftime(REPLY_DATE_FMT)
                 }
             })
         else:
-            return JsonResponse({
+            return ORJSONResponse({
                 'success': False,
-                'errors': form.errors
+                'errors': errors
             }, status=400)
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'success': False,
-            'error': 'Invalid JSON data'
-        }, status=400)
+    except orjson.JSONDecodeError:
+        return HttpResponse(_INVALID_JSON, content_type='application/json', status=400)
     except Exception as e:
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -226,46 +340,82 @@ def submit_reply(request, note_id):
         db_rate_limiter.release()
 
 
-@require_http_methods(["GET"])
+@require_GET
+@cache_control(public=True, max_age=60)
+@condition(etag_func=_about_etag)
 def about_api(request):
     """API endpoint for about information"""
-    return JsonResponse({
-        'about': {
-            'name': 'Pour Your Mind',
-            'description': 'A platform to share your thoughts with the world, either anonymously or with your name.',
-            'features': [
-                'Share thoughts publicly',
-                'Post anonymously or with your name',
-                'Reply to others\' thoughts',
-                'View all thoughts in a feed'
-            ],
-            'version': '1.0.0'
-        }
-    })
+    return HttpResponse(_ABOUT_BYTES, content_type='application/json')
 
 
 # Authentication Views
 
+# Session entry holding [session user id, serialized user, expiry timestamp]
+USER_JSON_SESSION_KEY = '_user_json'
+USER_JSON_TTL = 60  # seconds
+
+
+def _remember_user_json(request, user):
+    """Cache the serialized user in the session so current_user can skip the user query"""
+    user_json = orjson.dumps({
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+    }).decode()
+    request.session[USER_JSON_SESSION_KEY] = [
+        request.session.get(SESSION_KEY), user_json, time.time() + USER_JSON_TTL]
+    return user_json
+
+
+def _authenticated_user_response(user_json):
+    return HttpResponse('{"authenticated":true,"user":' + user_json + '}',
+                        content_type='application/json')
+
+
+def _client_ip(request):
+    """
+    Client address used for throttling.
+
+    Only the X-Forwarded-For hops appended by the NUM_TRUSTED_PROXIES proxies
+    in front of the app are trusted; the hops to their left are chosen by the
+    client, so the address is counted from the right.
+    """
+    trusted = settings.NUM_TRUSTED_PROXIES
+    forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if trusted and forwarded_for:
+        hops = forwarded_for.split(',')
+        if len(hops) >= trusted:
+            return hops[-trusted].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def login_view(request):
     """API endpoint for user login"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         username = data.get('username')
         password = data.get('password')
 
         if not username or not password:
-            return JsonResponse({
-                'success': False,
-                'error': 'Username and password are required'
-            }, status=400)
+            return HttpResponse(_CREDS_REQUIRED, content_type='application/json', status=400)
+        if not isinstance(username, str):
+            return HttpResponse(_INVALID_CREDS, content_type='application/json', status=401)
+
+        # Reject repeated attempts before running the expensive password hasher.
+        # Without a trusted proxy REMOTE_ADDR may be shared by every client, so
+        # only the username is throttled
+        if ((settings.NUM_TRUSTED_PROXIES and not login_ip_throttle.hit(_client_ip(request)))
+                or not login_username_throttle.hit(username)):
+            return HttpResponse(_LOGIN_THROTTLED, content_type='application/json', status=429)
 
         user = authenticate(request, username=username, password=password)
 
         if user is not None:
             login(request, user)
-            return JsonResponse({
+            _remember_user_json(request, user)
+            return ORJSONResponse({
                 'success': True,
                 'user': {
                     'id': user.id,
@@ -274,86 +424,73 @@ def login_view(request):
                 }
             })
         else:
-            return JsonResponse({
-                'success': False,
-                'error': 'Invalid username or password'
-            }, status=401)
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'success': False,
-            'error': 'Invalid JSON data'
-        }, status=400)
+            return HttpResponse(_INVALID_CREDS, content_type='application/json', status=401)
+    except orjson.JSONDecodeError:
+        return HttpResponse(_INVALID_JSON, content_type='application/json', status=400)
     except Exception as e:
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
         }, status=500)
 
 
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def logout_view(request):
     """API endpoint for user logout"""
     logout(request)
-    return JsonResponse({
-        'success': True,
-        'message': 'Logged out successfully'
-    })
+    return HttpResponse(_LOGGED_OUT, content_type='application/json')
 
 
-@require_http_methods(["GET"])
+@require_GET
 def current_user(request):
     """API endpoint to get current logged-in user"""
+    # Fast path: answer from the session without loading the user
+    cached = request.session.get(USER_JSON_SESSION_KEY)
+    if (cached and cached[0] == request.session.get(SESSION_KEY)
+            and cached[2] > time.time()):
+        return _authenticated_user_response(cached[1])
+
     if request.user.is_authenticated:
-        return JsonResponse({
-            'authenticated': True,
-            'user': {
-                'id': request.user.id,
-                'username': request.user.username,
-                'email': request.user.email,
-            }
-        })
+        return _authenticated_user_response(_remember_user_json(request, request.user))
     else:
-        return JsonResponse({
+        return ORJSONResponse({
             'authenticated': False,
             'user': None
         })
 
 
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def register_view(request):
     """API endpoint for user registration"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         username = data.get('username')
         password = data.get('password')
         email = data.get('email', '')
 
         if not username or not password:
-            return JsonResponse({
-                'success': False,
-                'error': 'Username and password are required'
-            }, status=400)
-
-        # Check if username already exists
-        if User.objects.filter(username=username).exists():
-            return JsonResponse({
-                'success': False,
-                'error': 'Username already exists'
-            }, status=400)
-
-        # Create new user
-        user = User.objects.create_user(
-            username=username,
-            password=password,
-            email=email
-        )
-
-        # Log the user in
-        login(request, user)
-
-        return JsonResponse({
+            return HttpResponse(_CREDS_REQUIRED, content_type='application/json', status=400)
+
+        # Create new user; the unique username constraint rejects duplicates
+        # atomically, without a separate existence check
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    password=password,
+                    email=email
+                )
+        except IntegrityError:
+            return HttpResponse(_USERNAME_TAKEN, content_type='application/json', status=400)
+
+        # Log the user in; the user was not returned by authenticate(), so name
+        # the backend instead of having login() look it up
+        login(request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
+        _remember_user_json(request, user)
+
+        return ORJSONResponse({
             'success': True,
             'user': {
                 'id': user.id,
@@ -361,13 +498,10 @@ def register_view(request):
                 'email': user.email,
             }
         })
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'success': False,
-            'error': 'Invalid JSON data'
-        }, status=400)
+    except orjson.JSONDecodeError:
+        return HttpResponse(_INVALID_JSON, content_type='application/json', status=400)
     except Exception as e:
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -375,40 +509,39 @@ def register_view(request):
 
 # ============== Monitoring Test Endpoints ==============
 
-@require_http_methods(["GET"])
+@require_GET
 def test_error_400(request):
     """Test endpoint that returns 400 Bad Request"""
-    return JsonResponse({
+    return ORJSONResponse({
         'success': False,
         'error': 'Test 400 Bad Request error for monitoring'
     }, status=400)
 
 
-@require_http_methods(["GET"])
+@require_GET
 def test_error_500(request):
     """Test endpoint that returns 500 Internal Server Error"""
-    return JsonResponse({
+    return ORJSONResponse({
         'success': False,
         'error': 'Test 500 Internal Server Error for monitoring'
     }, status=500)
 
 
-@require_http_methods(["GET"])
+@require_GET
 def test_slow(request):
     """Test endpoint with artificial delay for latency testing"""
-    import time
     import random
     # Random delay between 0.5 and 2 seconds
     delay = random.uniform(0.5, 2.0)
     time.sleep(delay)
-    return JsonResponse({
+    return ORJSONResponse({
         'success': True,
         'message': f'Slow response after {delay:.2f}s delay'
     })
 
 
 @csrf_exempt
-@require_http_methods(["POST"])
+@require_POST
 def test_rate_limiter(request):
     """
     Test endpoint specifically for rate limiter testing.
@@ -422,7 +555,7 @@ def test_rate_limiter(request):
     # With 2 workers, total capacity = 4 concurrent operations
     # Use blocking=False to return 429 immediately when at capacity
     if not db_rate_limiter.acquire(blocking=False):
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': 'Rate limit exceeded. Too many concurrent requests.',
             'status': 'rate_limited',
@@ -432,10 +565,9 @@ def test_rate_limiter(request):
     try:
         # Simulate slow database operation (1 second)
         # This ensures requests take long enough to see rate limiting when sending concurrent requests
-        import time
         time.sleep(1.0)  # 1 second delay to simulate database write
 
-        return JsonResponse({
+        return ORJSONResponse({
             'success': True,
             'message': 'Request processed successfully',
             'status': 'success',
@@ -448,7 +580,7 @@ def test_rate_limiter(request):
 
 # ============== Synchronization Demonstration Endpoints ==============
 
-@require_http_methods(["GET"])
+@require_GET
 def sync_demo(request):
     """
     Demonstration endpoint showing race conditions with and without mutex.
@@ -461,7 +593,7 @@ def sync_demo(request):
     """
     try:
         results = demonstrate_race_condition()
-        return JsonResponse({
+        return ORJSONResponse({
             'success': True,
             'demonstration': 'Race Condition with/without Mutex',
             'results': results,
@@ -478,13 +610,13 @@ def sync_demo(request):
             }
         })
     except Exception as e:
-        return JsonResponse({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
         }, status=500)
 
 
-@require_http_methods(["GET"])
+@require_GET
 def internal_metrics(request):
     """
     Internal metrics endpoint showing request counter statistics.
@@ -496,7 +628,7 @@ def internal_metrics(request):
         JSON response with request counter statistics
     """
     stats = request_counter.get_stats()
-    return JsonResponse({
+    return ORJSONResponse({
         'success': True,
         'metrics': {
             'total_requests': stats['total_requests'],
@@ -6,6 +6,8 @@ Supports local development (SQLite) and Kubernetes/OKE deployment (PostgreSQL)
 from pathlib import Path
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -92,12 +94,30 @@ WSGI_APPLICATION = 'pym_be.wsgi.application'
 # Database configuration
 # Uses PostgreSQL in Kubernetes/production, SQLite for local development
 
+# PostgreSQL connections are kept open for the life of a Gunicorn worker
+# (CONN_MAX_AGE=None) and checked before reuse (CONN_HEALTH_CHECKS), so
+# requests do not pay for a new connection and TLS handshake.
+# To pool through PgBouncer, point DATABASE_URL / DB_HOST at PgBouncer
+# instead of PostgreSQL; in transaction pooling mode also set
+# DB_PGBOUNCER=true, which disables server-side cursors (used by
+# QuerySet.iterator()) since they cannot outlive a pooled transaction.
+POSTGRES_OPTIONS = {
+    'sslmode': os.environ.get('DB_SSLMODE', 'prefer'),
+    'application_name': os.environ.get('DB_APPLICATION_NAME', 'pym_be'),
+}
+DB_PGBOUNCER = os.environ.get('DB_PGBOUNCER', 'False').lower() in ('true', '1', 'yes')
+
 if os.environ.get('DATABASE_URL'):
     # Use dj-database-url for DATABASE_URL format
     import dj_database_url
     DATABASES = {
-        'default': dj_database_url.config(conn_max_age=600)
+        'default': dj_database_url.config(conn_max_age=None, conn_health_checks=True)
     }
+    if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+        # Options given in the URL query string (e.g. ?sslmode=require) take precedence
+        DATABASES['default']['OPTIONS'] = {
+            **POSTGRES_OPTIONS, **DATABASES['default'].get('OPTIONS', {})}
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = DB_PGBOUNCER
 elif os.environ.get('POSTGRES_DB'):
     # Kubernetes environment with individual env vars
     DATABASES = {
@@ -108,14 +128,32 @@ elif os.environ.get('POSTGRES_DB'):
             'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
             'HOST': os.environ.get('DB_HOST', 'postgres-service'),
             'PORT': os.environ.get('DB_PORT', '5432'),
+            'CONN_MAX_AGE': None,
+            'CONN_HEALTH_CHECKS': True,
+            'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER,
+            'OPTIONS': POSTGRES_OPTIONS,
         }
     }
+elif IS_PRODUCTION:
+    # SQLite serializes every write through one file lock, which stalls the
+    # submit endpoints as soon as several Gunicorn workers write at once
+    raise ImproperlyConfigured(
+        'Production requires PostgreSQL: set DATABASE_URL or POSTGRES_DB.')
 else:
     # Local development with SQLite
+    # WAL lets readers proceed during a write, and busy_timeout makes a
+    # writer wait for the lock instead of failing with "database is locked"
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                'init_command': (
+                    'PRAGMA journal_mode=WAL; '
+                    'PRAGMA synchronous=NORMAL; '
+                    'PRAGMA busy_timeout=5000;'
+                ),
+            },
         }
     }
 
@@ -142,7 +180,20 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
+# Django 5.1 removed STATICFILES_STORAGE, so the storage is set via STORAGES.
+# With whitenoise[brotli] installed, collectstatic writes a .br file next to
+# each .gz one and WhiteNoise serves it to clients that accept brotli.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# Templates only reference hashed names, so skip the unhashed copies
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 
 # Default primary key field type
 
@@ -209,6 +260,15 @@ BACKEND_URL = os.environ.get('BACKEND_URL', '')
 if BACKEND_URL:
     CSRF_TRUSTED_ORIGINS.append(BACKEND_URL)
 
+# Reverse proxy settings
+# Number of reverse proxies in front of Gunicorn that append to X-Forwarded-For
+# (e.g. 1 behind nginx's $proxy_add_x_forwarded_for). The client address is
+# the hop the outermost trusted proxy appended; anything left of it was sent
+# by the client. Leave at 0 when Gunicorn is reachable directly, otherwise
+# clients could pick their own address and dodge the login throttle; at 0
+# logins are throttled per username only.
+NUM_TRUSTED_PROXIES = int(os.environ.get('NUM_TRUSTED_PROXIES', '0'))
+
 # Cross-origin cookie settings
 # Use SECURE cookies only if USE_HTTPS env var is set
 USE_HTTPS = os.environ.get(